@@ -2,96 +2,66 @@
 """
 Continue corporate website — export existing screens, create remaining ones.
 """
-import json
+import asyncio
+import concurrent.futures
+import functools
 import time
-import urllib.request
+
+from mockupmcp_client import MCPHTTPError, MockupClient, dumps, elapsed_ms
 
 SESSION_ID = "ffba88af-54d6-46c3-ad55-8abdfa7df1e0"
 BASE_URL = "http://localhost:3200/mcp"
 PROJECT_ID = "proj_oUwIukpLme"
 
-_id_counter = 500
-
-def next_id():
-    global _id_counter
-    _id_counter += 1
-    return _id_counter
-
-def mcp_call(method, params):
-    payload = {
-        "jsonrpc": "2.0",
-        "id": next_id(),
-        "method": method,
-        "params": params
-    }
-    body = json.dumps(payload).encode()
-    req = urllib.request.Request(
-        BASE_URL,
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-            "mcp-session-id": SESSION_ID
-        },
-        method="POST"
-    )
-    with urllib.request.urlopen(req, timeout=300) as resp:
-        raw = resp.read().decode()
-
-    result_text = ""
-    for line in raw.splitlines():
-        if line.startswith("data: "):
-            result_text = line[6:]
-            break
-    if not result_text:
-        result_text = raw.strip()
-
-    data = json.loads(result_text)
-    if "error" in data:
-        raise Exception(f"MCP error: {data['error']}")
-    return data.get("result", {})
-
-def tool_call(tool_name, arguments):
-    result = mcp_call("tools/call", {"name": tool_name, "arguments": arguments})
-    content = result.get("content", [])
-    if result.get("isError"):
-        raise Exception(f"Tool error in {tool_name}: {content[0]['text'] if content else 'unknown'}")
-    if content and content[0].get("type") == "text":
+# Max MCP requests in flight; raise until total time in the summary plateaus
+MAX_IN_FLIGHT = 4
+# Transport failures of read-only calls (exports) are retried with exponential
+# backoff (0.5s, 1s, ... capped)
+RETRY_ATTEMPTS = 3
+RETRY_MAX_WAIT = 5
+
+client = MockupClient(SESSION_ID, BASE_URL, PROJECT_ID)
+
+def _is_transient(exc):
+    # Read timeouts (TimeoutError) are not retried: the 300 s budget is already spent
+    if isinstance(exc, MCPHTTPError):
+        return exc.status >= 500
+    return isinstance(exc, ConnectionError)
+
+# Bounds concurrent requests so adding pages doesn't pile work onto the server
+_in_flight = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+async def _call(fn, *args, timing=None, retry=False):
+    # The blocking client call runs in a worker thread (each with its own
+    # keep-alive connection) so gathered calls overlap. When a timing dict is
+    # passed, timing["start"] is set once the first attempt holds an in-flight
+    # slot: callers time the call without the initial queueing, but failed
+    # attempts and backoff still count.
+    # Only callers whose request is safe to repeat pass retry=True: a dropped
+    # connection or a 5xx doesn't say whether the server already applied a
+    # write, and a resent create would add a duplicate screen.
+    attempts = RETRY_ATTEMPTS if retry else 1
+    for attempt in range(attempts):
         try:
-            return json.loads(content[0]["text"])
-        except:
-            return content[0]["text"]
-    return result
-
-def ms():
-    return int(time.time() * 1000)
-
-def create_screen(name, width=1440, height=900, background="#FFFFFF", style="flat"):
-    return tool_call("mockup_add_screen", {
-        "project_id": PROJECT_ID,
-        "name": name,
-        "width": width,
-        "height": height,
-        "background": background,
-        "style": style
-    })
-
-def bulk_add(screen_id, elements):
-    return tool_call("mockup_bulk_add_elements", {
-        "project_id": PROJECT_ID,
-        "screen_id": screen_id,
-        "elements": elements
-    })
-
-def export_png(screen_id):
-    return tool_call("mockup_export", {
-        "project_id": PROJECT_ID,
-        "screen_id": screen_id,
-        "format": "png",
-        "scale": 1
-    })
-
-# Common elements
+            async with _in_flight:
+                if timing is not None and attempt == 0:
+                    timing["start"] = time.perf_counter_ns()
+                return await asyncio.to_thread(fn, *args)
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_transient(e):
+                raise
+            await asyncio.sleep(min(0.5 * 2 ** attempt, RETRY_MAX_WAIT))
+
+# `elements_json` is the already-encoded elements array (see page_payload)
+async def create_screen_full(name, elements_json, timing=None):
+    return await _call(client.create_screen_full, name, elements_json, timing=timing)
+
+async def export_png(screen_id, timing=None):
+    return await _call(client.export_png, screen_id, timing=timing, retry=True)
+
+# Common elements — memoized and returned as tuples; element dicts are only
+# ever serialized, never mutated, so pages share them by reference
+@functools.lru_cache(maxsize=8)
 def navbar_elements(active_item="Home"):
     items = ["Home", "About", "Services", "Portfolio", "Contact"]
     x_positions = [500, 590, 670, 760, 850]
@@ -112,10 +82,11 @@ def navbar_elements(active_item="Home"):
         "properties": {"label": "Get Started", "color": "#FFFFFF", "backgroundColor": "#4F46E5", "fontSize": 14},
         "z_index": 11
     })
-    return elems
+    return tuple(elems)
 
+@functools.lru_cache(maxsize=1)
 def footer_elements():
-    return [
+    return (
         {"type": "rectangle", "x": 0, "y": 840, "width": 1440, "height": 60,
          "properties": {"label": "", "backgroundColor": "#0F0F1A"}},
         {"type": "text", "x": 48, "y": 855, "width": 160, "height": 22,
@@ -124,7 +95,7 @@ def footer_elements():
          "properties": {"label": "© 2026 Acme Corp. All rights reserved.", "color": "#64748B", "fontSize": 13, "textAlign": "center"}},
         {"type": "text", "x": 1240, "y": 860, "width": 152, "height": 18,
          "properties": {"label": "Privacy · Terms · Contact", "color": "#64748B", "fontSize": 13}},
-    ]
+    )
 
 def section_hero(title, subtitle, y=60, height=220, bg="#4F46E5"):
     return [
@@ -137,96 +108,111 @@ def section_hero(title, subtitle, y=60, height=220, bg="#4F46E5"):
     ]
 
 # PAGE 4: PORTFOLIO
+# Project cards as parallel columns (structure of arrays)
+_TITLES = ("FinTech Dashboard", "HealthCare Portal", "E-Commerce Platform",
+           "Logistics Tracker", "EdTech LMS", "AI Analytics Suite")
+_CATS = ("Data Analytics", "Product Dev", "Cloud + Dev",
+         "Mobile App", "Product Dev", "Data + AI")
+_COLORS = ("#DBEAFE", "#DCFCE7", "#FEF3C7", "#FCE7F3", "#EDE9FE", "#CFFAFE")
+_XS = (48, 512, 976, 48, 512, 976)
+_YS = (296, 296, 296, 560, 560, 560)
+
+def _expand():
+    for title, cat, color, x, y in zip(_TITLES, _CATS, _COLORS, _XS, _YS):
+        yield from (
+            {"type": "rectangle", "x": x, "y": y, "width": 416, "height": 240,
+             "properties": {"label": "", "backgroundColor": "#F8FAFC", "borderRadius": 10}},
+            {"type": "image", "x": x + 16, "y": y + 16, "width": 384, "height": 160,
+             "properties": {"label": title, "backgroundColor": color}},
+            {"type": "text", "x": x + 16, "y": y + 184, "width": 256, "height": 24,
+             "properties": {"label": title, "color": "#1A1A2E", "fontSize": 16, "fontWeight": "bold"}},
+            {"type": "text", "x": x + 292, "y": y + 188, "width": 108, "height": 18,
+             "properties": {"label": cat, "color": "#7C3AED", "fontSize": 12, "textAlign": "right"}},
+            {"type": "text", "x": x + 16, "y": y + 210, "width": 120, "height": 20,
+             "properties": {"label": "View Case Study →", "color": "#4F46E5", "fontSize": 13}},
+        )
+
+# All coordinates are literal constants, so the cards are resolved once at import
+_PORTFOLIO_CARDS = tuple(_expand())
+
 def portfolio_elements():
-    elems = navbar_elements("Portfolio")
+    elems = list(navbar_elements("Portfolio"))
     elems += section_hero(
         "Our Work",
         "A selection of projects we are proud of — from startups to Fortune 500 companies.",
         y=60, height=220, bg="#7C3AED"
     )
-    projects = [
-        {"title": "FinTech Dashboard", "cat": "Data Analytics", "color": "#DBEAFE", "x": 48, "y": 296},
-        {"title": "HealthCare Portal", "cat": "Product Dev", "color": "#DCFCE7", "x": 512, "y": 296},
-        {"title": "E-Commerce Platform", "cat": "Cloud + Dev", "color": "#FEF3C7", "x": 976, "y": 296},
-        {"title": "Logistics Tracker", "cat": "Mobile App", "color": "#FCE7F3", "x": 48, "y": 560},
-        {"title": "EdTech LMS", "cat": "Product Dev", "color": "#EDE9FE", "x": 512, "y": 560},
-        {"title": "AI Analytics Suite", "cat": "Data + AI", "color": "#CFFAFE", "x": 976, "y": 560},
-    ]
-    for p in projects:
-        elems += [
-            {"type": "rectangle", "x": p["x"], "y": p["y"], "width": 416, "height": 240,
-             "properties": {"label": "", "backgroundColor": "#F8FAFC", "borderRadius": 10}},
-            {"type": "image", "x": p["x"] + 16, "y": p["y"] + 16, "width": 384, "height": 160,
-             "properties": {"label": p["title"], "backgroundColor": p["color"]}},
-            {"type": "text", "x": p["x"] + 16, "y": p["y"] + 184, "width": 256, "height": 24,
-             "properties": {"label": p["title"], "color": "#1A1A2E", "fontSize": 16, "fontWeight": "bold"}},
-            {"type": "text", "x": p["x"] + 292, "y": p["y"] + 188, "width": 108, "height": 18,
-             "properties": {"label": p["cat"], "color": "#7C3AED", "fontSize": 12, "textAlign": "right"}},
-            {"type": "text", "x": p["x"] + 16, "y": p["y"] + 210, "width": 120, "height": 20,
-             "properties": {"label": "View Case Study →", "color": "#4F46E5", "fontSize": 13}},
-        ]
+    elems += _PORTFOLIO_CARDS
     elems += footer_elements()
     return elems
 
 # PAGE 5: CONTACT
+_CONTACT_FORM = (
+    # Contact form card
+    {"type": "rectangle", "x": 80, "y": 272, "width": 672, "height": 532,
+     "properties": {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
+                    "borderColor": "#E2E8F0", "borderWidth": 1}},
+    {"type": "text", "x": 112, "y": 296, "width": 608, "height": 32,
+     "properties": {"label": "Send Us a Message", "color": "#1A1A2E", "fontSize": 22, "fontWeight": "bold"}},
+    # Full Name
+    {"type": "text", "x": 112, "y": 344, "width": 200, "height": 20,
+     "properties": {"label": "Full Name *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
+    {"type": "input", "x": 112, "y": 368, "width": 608, "height": 48,
+     "properties": {"label": "John Doe", "color": "#9CA3AF", "fontSize": 15, "backgroundColor": "#F9FAFB"}},
+    # Email
+    {"type": "text", "x": 112, "y": 432, "width": 200, "height": 20,
+     "properties": {"label": "Email Address *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
+    {"type": "input", "x": 112, "y": 456, "width": 608, "height": 48,
+     "properties": {"label": "john@example.com", "color": "#9CA3AF", "fontSize": 15, "backgroundColor": "#F9FAFB"}},
+    # Subject
+    {"type": "text", "x": 112, "y": 520, "width": 200, "height": 20,
+     "properties": {"label": "Subject", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
+    {"type": "input", "x": 112, "y": 544, "width": 608, "height": 48,
+     "properties": {"label": "How can we help?", "color": "#9CA3AF", "fontSize": 15, "backgroundColor": "#F9FAFB"}},
+    # Message
+    {"type": "text", "x": 112, "y": 608, "width": 200, "height": 20,
+     "properties": {"label": "Message *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
+    {"type": "rectangle", "x": 112, "y": 632, "width": 608, "height": 120,
+     "properties": {"label": "Tell us about your project...", "backgroundColor": "#F9FAFB",
+                    "borderRadius": 6, "borderColor": "#D1D5DB", "borderWidth": 1, "color": "#9CA3AF", "fontSize": 15}},
+    {"type": "button", "x": 112, "y": 768, "width": 608, "height": 48,
+     "properties": {"label": "Send Message", "color": "#FFFFFF", "backgroundColor": "#BE185D", "fontSize": 16}},
+    # Map placeholder
+    {"type": "image", "x": 800, "y": 272, "width": 560, "height": 340,
+     "properties": {"label": "Map — 123 Innovation Drive, San Francisco CA", "backgroundColor": "#CBD5E1"}},
+    # Contact info box
+    {"type": "rectangle", "x": 800, "y": 624, "width": 560, "height": 180,
+     "properties": {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
+                    "borderColor": "#E2E8F0", "borderWidth": 1}},
+    {"type": "text", "x": 824, "y": 640, "width": 512, "height": 24,
+     "properties": {"label": "Contact Information", "color": "#1A1A2E", "fontSize": 18, "fontWeight": "bold"}},
+    {"type": "text", "x": 824, "y": 672, "width": 512, "height": 20,
+     "properties": {"label": "hello@acmecorp.com", "color": "#475569", "fontSize": 14}},
+    {"type": "text", "x": 824, "y": 700, "width": 512, "height": 20,
+     "properties": {"label": "+1 (415) 555-0192", "color": "#475569", "fontSize": 14}},
+    {"type": "text", "x": 824, "y": 728, "width": 512, "height": 20,
+     "properties": {"label": "123 Innovation Drive, San Francisco, CA 94105", "color": "#475569", "fontSize": 14}},
+    {"type": "text", "x": 824, "y": 756, "width": 512, "height": 20,
+     "properties": {"label": "Mon-Fri, 9 AM to 6 PM PST", "color": "#475569", "fontSize": 14}},
+)
+
 def contact_elements():
-    elems = navbar_elements("Contact")
+    elems = list(navbar_elements("Contact"))
     elems += section_hero(
         "Get In Touch",
         "Have a project in mind? We would love to hear from you. Send us a message!",
         y=60, height=196, bg="#BE185D"
     )
-    elems += [
-        # Contact form card
-        {"type": "rectangle", "x": 80, "y": 272, "width": 672, "height": 532,
-         "properties": {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
-                        "borderColor": "#E2E8F0", "borderWidth": 1}},
-        {"type": "text", "x": 112, "y": 296, "width": 608, "height": 32,
-         "properties": {"label": "Send Us a Message", "color": "#1A1A2E", "fontSize": 22, "fontWeight": "bold"}},
-        # Full Name
-        {"type": "text", "x": 112, "y": 344, "width": 200, "height": 20,
-         "properties": {"label": "Full Name *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
-        {"type": "input", "x": 112, "y": 368, "width": 608, "height": 48,
-         "properties": {"label": "John Doe", "color": "#9CA3AF", "fontSize": 15, "backgroundColor": "#F9FAFB"}},
-        # Email
-        {"type": "text", "x": 112, "y": 432, "width": 200, "height": 20,
-         "properties": {"label": "Email Address *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
-        {"type": "input", "x": 112, "y": 456, "width": 608, "height": 48,
-         "properties": {"label": "john@example.com", "color": "#9CA3AF", "fontSize": 15, "backgroundColor": "#F9FAFB"}},
-        # Subject
-        {"type": "text", "x": 112, "y": 520, "width": 200, "height": 20,
-         "properties": {"label": "Subject", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
-        {"type": "input", "x": 112, "y": 544, "width": 608, "height": 48,
-         "properties": {"label": "How can we help?", "color": "#9CA3AF", "fontSize": 15, "backgroundColor": "#F9FAFB"}},
-        # Message
-        {"type": "text", "x": 112, "y": 608, "width": 200, "height": 20,
-         "properties": {"label": "Message *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
-        {"type": "rectangle", "x": 112, "y": 632, "width": 608, "height": 120,
-         "properties": {"label": "Tell us about your project...", "backgroundColor": "#F9FAFB",
-                        "borderRadius": 6, "borderColor": "#D1D5DB", "borderWidth": 1, "color": "#9CA3AF", "fontSize": 15}},
-        {"type": "button", "x": 112, "y": 768, "width": 608, "height": 48,
-         "properties": {"label": "Send Message", "color": "#FFFFFF", "backgroundColor": "#BE185D", "fontSize": 16}},
-        # Map placeholder
-        {"type": "image", "x": 800, "y": 272, "width": 560, "height": 340,
-         "properties": {"label": "Map — 123 Innovation Drive, San Francisco CA", "backgroundColor": "#CBD5E1"}},
-        # Contact info box
-        {"type": "rectangle", "x": 800, "y": 624, "width": 560, "height": 180,
-         "properties": {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
-                        "borderColor": "#E2E8F0", "borderWidth": 1}},
-        {"type": "text", "x": 824, "y": 640, "width": 512, "height": 24,
-         "properties": {"label": "Contact Information", "color": "#1A1A2E", "fontSize": 18, "fontWeight": "bold"}},
-        {"type": "text", "x": 824, "y": 672, "width": 512, "height": 20,
-         "properties": {"label": "hello@acmecorp.com", "color": "#475569", "fontSize": 14}},
-        {"type": "text", "x": 824, "y": 700, "width": 512, "height": 20,
-         "properties": {"label": "+1 (415) 555-0192", "color": "#475569", "fontSize": 14}},
-        {"type": "text", "x": 824, "y": 728, "width": 512, "height": 20,
-         "properties": {"label": "123 Innovation Drive, San Francisco, CA 94105", "color": "#475569", "fontSize": 14}},
-        {"type": "text", "x": 824, "y": 756, "width": 512, "height": 20,
-         "properties": {"label": "Mon-Fri, 9 AM to 6 PM PST", "color": "#475569", "fontSize": 14}},
-    ]
+    elems += _CONTACT_FORM
     elems += footer_elements()
     return elems
 
+@functools.lru_cache(maxsize=None)
+def page_payload(elements_fn):
+    """Encoded elements array and element count for a page, built once."""
+    elements = elements_fn()
+    return dumps(elements), len(elements)
+
 # Existing screens (already created)
 existing = [
     {"idx": 1, "name": "Home", "screen_id": "scr_Q9k4Hy2vNg", "num_elements": 38, "creation_ms": 42},
@@ -240,72 +226,97 @@ new_pages = [
     (5, "Contact", contact_elements),
 ]
 
-results = []
-
-print("=" * 70)
-print("CORPORATE WEBSITE — Continuing from Services...")
-print(f"Project: {PROJECT_ID}")
-print("=" * 70)
-
-# Process existing screens (export only)
-for ex in existing:
+async def export_existing(ex):
     print(f"\n[{ex['idx']}/5] Exporting existing screen: {ex['name']} ({ex['screen_id']})")
-    t_exp_start = ms()
+    timing = {"start": time.perf_counter_ns()}
     try:
-        export_png(ex["screen_id"])
-        t_exp_end = ms()
-        export_time = t_exp_end - t_exp_start
-        print(f"  Export time: {export_time} ms")
+        await export_png(ex["screen_id"], timing)
+        export_time = elapsed_ms(timing["start"])
+        print(f"  [{ex['name']}] Export time: {export_time} ms")
     except Exception as e:
-        t_exp_end = ms()
-        export_time = t_exp_end - t_exp_start
-        print(f"  Export FAILED after {export_time} ms: {e}")
+        export_time = elapsed_ms(timing["start"])
+        print(f"  [{ex['name']}] Export FAILED after {export_time} ms: {e}")
         export_time = -1
-    results.append({
+    return {
         "idx": ex["idx"],
         "name": ex["name"],
         "screen_id": ex["screen_id"],
         "creation_ms": ex["creation_ms"],
         "num_elements": ex["num_elements"],
         "export_ms": export_time,
-    })
+    }
 
-# Create and export new screens
-for idx, name, elements_fn in new_pages:
+# Concurrent pages take turns creating (see MockupClient.create_screen_full)
+_write_lock = asyncio.Lock()
+
+async def build_page(idx, name, elements_fn):
     print(f"\n[{idx}/5] Creating screen: {name}")
 
-    t_start = ms()
-    screen = create_screen(name)
-    screen_id = screen["id"]
-    elements = elements_fn()
-    num_elements = len(elements)
-    bulk_add(screen_id, elements)
-    t_end = ms()
-    creation_time = t_end - t_start
+    # Pure CPU — build before the first await so it doesn't sit on the RTT path
+    elements_json, num_elements = page_payload(elements_fn)
+
+    # Timed from when the request gets an in-flight slot, not from when it
+    # starts queueing behind the exports
+    timing = {}
+    async with _write_lock:
+        screen = await create_screen_full(name, elements_json, timing=timing)
+        screen_id = screen["screen_id"]
+        creation_time = elapsed_ms(timing["start"])
 
-    print(f"  Screen ID: {screen_id} | Elements: {num_elements} | Creation: {creation_time} ms")
+    print(f"  [{name}] Screen ID: {screen_id} | Elements: {num_elements} | Creation: {creation_time} ms")
 
-    print(f"  Exporting PNG...")
-    t_exp_start = ms()
+    print(f"  [{name}] Exporting PNG...")
+    timing = {"start": time.perf_counter_ns()}
     try:
-        export_png(screen_id)
-        t_exp_end = ms()
-        export_time = t_exp_end - t_exp_start
-        print(f"  Export time: {export_time} ms")
+        await export_png(screen_id, timing)
+        export_time = elapsed_ms(timing["start"])
+        print(f"  [{name}] Export time: {export_time} ms")
     except Exception as e:
-        t_exp_end = ms()
-        export_time = t_exp_end - t_exp_start
-        print(f"  Export FAILED after {export_time} ms: {e}")
+        export_time = elapsed_ms(timing["start"])
+        print(f"  [{name}] Export FAILED after {export_time} ms: {e}")
         export_time = -1
 
-    results.append({
+    return {
         "idx": idx,
         "name": name,
         "screen_id": screen_id,
         "creation_ms": creation_time,
         "num_elements": num_elements,
         "export_ms": export_time,
-    })
+    }
+
+async def main():
+    # to_thread runs on the default executor; size it to the in-flight limit so
+    # every permitted request has a worker and no idle threads are spawned
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT, thread_name_prefix="mcp"))
+
+    # Existing-screen exports and new-page pipelines share no data, so they
+    # all go into one gather; server-side rendering overlaps with creation.
+    tasks = [export_existing(ex) for ex in existing] + [build_page(*p) for p in new_pages]
+    labels = [(ex["idx"], ex["name"]) for ex in existing] + [(p[0], p[1]) for p in new_pages]
+    # return_exceptions: one failed page must not cancel its siblings
+    outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = []
+    for (idx, name), r in zip(labels, outcomes):
+        if isinstance(r, Exception):
+            print(f"  [{name}] FAILED: {r}")
+            r = {"idx": idx, "name": name, "screen_id": "-",
+                 "creation_ms": 0, "num_elements": 0, "export_ms": -1}
+        results.append(r)
+    return results
+
+print("=" * 70)
+print("CORPORATE WEBSITE — Continuing from Services...")
+print(f"Project: {PROJECT_ID}")
+print("=" * 70)
+
+# Wall time of the whole run: exports and creates overlap, so the column
+# totals add up to more than this
+t_run = time.perf_counter_ns()
+results = asyncio.run(main())
+total_time = elapsed_ms(t_run)
 
 # Sort by idx
 results.sort(key=lambda r: r["idx"])
@@ -330,7 +341,6 @@ for r in results:
     total_elements += r["num_elements"]
 
 print("-" * 72)
-total_time = total_creation + total_export
 avg_creation = total_creation // 5
 avg_export = total_export // 5
 
@@ -8,72 +8,32 @@ Uses correct component property names:
   image:     (no custom bg — wireframe X pattern always rendered)
   input:     placeholder, label (field label above input), type
 """
-import json
+import functools
+import sys
 import time
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from mockupmcp_client import EXPORT_CACHE, MockupClient, dumps, elapsed_ms
 
 SESSION_ID = "ffba88af-54d6-46c3-ad55-8abdfa7df1e0"
 BASE_URL = "http://localhost:3200/mcp"
 PROJECT_ID = "proj_kLIQ1BZw2L"
+SCREEN = {"width": 1440, "height": 900, "background": "#FFFFFF", "style": "flat"}
 
-_id_counter = 600
-
-def next_id():
-    global _id_counter
-    _id_counter += 1
-    return _id_counter
-
-def mcp_call(method, params):
-    payload = {"jsonrpc": "2.0", "id": next_id(), "method": method, "params": params}
-    body = json.dumps(payload).encode()
-    req = urllib.request.Request(
-        BASE_URL, data=body,
-        headers={"Content-Type": "application/json",
-                 "Accept": "application/json, text/event-stream",
-                 "mcp-session-id": SESSION_ID},
-        method="POST"
-    )
-    with urllib.request.urlopen(req, timeout=300) as resp:
-        raw = resp.read().decode()
-    for line in raw.splitlines():
-        if line.startswith("data: "):
-            return json.loads(line[6:]).get("result", {})
-    return json.loads(raw.strip()).get("result", {})
-
-def tool(name, args):
-    result = mcp_call("tools/call", {"name": name, "arguments": args})
-    content = result.get("content", [])
-    if result.get("isError"):
-        raise Exception(f"{name} error: {content[0]['text'] if content else '?'}")
-    if content and content[0].get("type") == "text":
-        try:
-            return json.loads(content[0]["text"])
-        except:
-            return content[0]["text"]
-    return result
-
-def ms():
-    return int(time.time() * 1000)
-
-def add_screen(name):
-    return tool("mockup_add_screen", {
-        "project_id": PROJECT_ID, "name": name,
-        "width": 1440, "height": 900, "background": "#FFFFFF", "style": "flat"
-    })
-
-def bulk(screen_id, elements):
-    return tool("mockup_bulk_add_elements", {
-        "project_id": PROJECT_ID, "screen_id": screen_id, "elements": elements
-    })
-
-def export_png(screen_id):
-    return tool("mockup_export", {
-        "project_id": PROJECT_ID, "screen_id": screen_id, "format": "png", "scale": 1
-    })
+# --cache: skip the server export of a page whose identical definition was
+# already rendered on an earlier run; the new screen then has no export of
+# its own and the earlier PNG under ~/.cache/mockupmcp (path printed) stands
+# in for it. Add --force to re-export everything and refresh the cache.
+CACHE = "--cache" in sys.argv[1:]
+FORCE = "--force" in sys.argv[1:]
+
+client = MockupClient(SESSION_ID, BASE_URL, PROJECT_ID)
 
 # ──────────────────────────────────────────────────────────────
 # ELEMENT HELPERS (correct props)
 # ──────────────────────────────────────────────────────────────
+# "properties" stays nested — the server's element schema strips unknown
+# top-level keys — but is left out where empty, the schema defaults it to {}.
 
 def rect(x, y, w, h, fill="#F5F5F5", stroke="#DDDDDD", radius=0, z=0):
     return {"type": "rectangle", "x": x, "y": y, "width": w, "height": h, "z_index": z,
@@ -96,8 +56,7 @@ def inp(x, y, w, h, placeholder, field_label=None, z=0):
             "properties": props}
 
 def img(x, y, w, h, z=0):
-    return {"type": "image", "x": x, "y": y, "width": w, "height": h, "z_index": z,
-            "properties": {}}
+    return {"type": "image", "x": x, "y": y, "width": w, "height": h, "z_index": z}
 
 # ──────────────────────────────────────────────────────────────
 # SHARED SECTIONS
@@ -110,7 +69,17 @@ SLATE = "#64748B"
 WHITE = "#FFFFFF"
 LIGHT = "#F8FAFC"
 BORDER = "#E2E8F0"
-
+INDIGO_TINT = "#C7D2FE"
+VIOLET = "#7C3AED"
+GREEN = "#059669"
+LIGHT_GREEN = "#ECFDF5"
+DARK_GREEN = "#065F46"
+MUTED = "#475569"
+FOOTER_BG = "#0F0F1A"
+
+# navbar/footer are identical across pages apart from the active item: build
+# once and share the (never mutated) element dicts via a cached tuple
+@functools.lru_cache(maxsize=8)
 def navbar(active="Home"):
     items = [("Home", 502), ("About", 592), ("Services", 674), ("Portfolio", 764), ("Contact", 856)]
     els = [
@@ -121,36 +90,74 @@ def navbar(active="Home"):
         color = WHITE if name == active else "#A5B4FC"
         els.append(txt(x, 18, 80, 24, name, color=color, size=14, z=11))
     els.append(btn(1296, 14, 120, 32, "Get Started", variant="outline", size="sm", z=11))
-    return els
+    return tuple(els)
 
+@functools.lru_cache(maxsize=1)
 def footer():
-    return [
-        rect(0, 840, 1440, 60, fill="#0F0F1A", stroke="#0F0F1A"),
+    return (
+        rect(0, 840, 1440, 60, fill=FOOTER_BG, stroke=FOOTER_BG),
         txt(48, 855, 160, 22, "Acme Corp", color=WHITE, size=16, weight="bold"),
-        txt(480, 862, 480, 18, "© 2026 Acme Corp. All rights reserved.", color="#475569", size=13, align="center"),
-        txt(1240, 862, 160, 18, "Privacy · Terms · Contact", color="#475569", size=12),
-    ]
+        txt(480, 862, 480, 18, "© 2026 Acme Corp. All rights reserved.", color=MUTED, size=13, align="center"),
+        txt(1240, 862, 160, 18, "Privacy · Terms · Contact", color=MUTED, size=12),
+    )
+
+# ...and their encoded JSON, minus the enclosing [ ], to splice around each
+# page's own body when building the request
+@functools.lru_cache(maxsize=8)
+def navbar_json(active):
+    return dumps(navbar(active))[1:-1]
+
+@functools.lru_cache(maxsize=1)
+def footer_json():
+    return dumps(footer())[1:-1]
+
+# Repeated blocks (cards, stats, team members) are laid out once at import as
+# templates at origin; stamp() copies one into place and fills the text slots
+# marked None, so the fixed styling isn't rebuilt on every iteration
+def stamp(template, dx, dy, *texts):
+    texts = iter(texts)
+    out = []
+    for el in template:
+        el = el.copy()
+        el["x"] += dx
+        el["y"] += dy
+        props = el.get("properties")
+        if props and props.get("content", "") is None:
+            el["properties"] = {**props, "content": next(texts)}
+        out.append(el)
+    return out
 
 def hero(title, subtitle, y=60, h=240, bg=INDIGO):
     return [
         rect(0, y, 1440, h, fill=bg, stroke=bg),
         txt(200, y+56, 1040, 64, title, color=WHITE, size=44, weight="bold", align="center"),
-        txt(320, y+132, 800, 52, subtitle, color="#C7D2FE", size=17, align="center"),
+        txt(320, y+132, 800, 52, subtitle, color=INDIGO_TINT, size=17, align="center"),
     ]
 
 # ──────────────────────────────────────────────────────────────
 # PAGE 1: HOME
 # ──────────────────────────────────────────────────────────────
 
+_FEATURE_CARD = (
+    rect(0, 0, 416, 200, fill=LIGHT, stroke=BORDER, radius=10),
+    txt(24, 20, 368, 28, None, color=NAVY, size=18, weight="bold"),
+    txt(24, 56, 368, 80, None, color=SLATE, size=14),
+    txt(24, 152, 140, 24, "Learn more →", color=INDIGO, size=14),
+)
+_STAT = (
+    txt(0, 676, 176, 52, None, color=INDIGO, size=36, weight="bold", align="center"),
+    txt(0, 732, 176, 24, None, color=SLATE, size=14, align="center"),
+)
+
 def home_elements():
-    els = navbar("Home")
+    els = []
     # Hero with CTAs
     els += [
         rect(0, 60, 1440, 340, fill=INDIGO, stroke=INDIGO),
         txt(200, 124, 1040, 72, "Build Better Products Faster",
             color=WHITE, size=52, weight="bold", align="center"),
         txt(320, 208, 800, 56, "We help businesses transform their digital presence with cutting-edge solutions.",
-            color="#C7D2FE", size=18, align="center"),
+            color=INDIGO_TINT, size=18, align="center"),
         btn(556, 290, 168, 48, "Start Free Trial", variant="ghost", size="lg"),
         btn(736, 290, 152, 48, "Learn More", variant="outline", size="lg"),
     ]
@@ -164,30 +171,28 @@ def home_elements():
          "Real-time dashboards give you actionable insights to grow the business."),
     ]
     for x, y, title, desc in card_data:
-        els += [
-            rect(x, y, 416, 200, fill=LIGHT, stroke=BORDER, radius=10),
-            txt(x+24, y+20, 368, 28, title, color=NAVY, size=18, weight="bold"),
-            txt(x+24, y+56, 368, 80, desc, color=SLATE, size=14),
-            txt(x+24, y+152, 140, 24, "Learn more →", color=INDIGO, size=14),
-        ]
+        els += stamp(_FEATURE_CARD, x, y, title, desc)
     # Stats bar
     els.append(rect(0, 652, 1440, 152, fill=LIGHT_INDIGO, stroke=LIGHT_INDIGO))
     stats = [("500+", "Clients", 176), ("99.9%", "Uptime SLA", 512),
              ("10x", "Faster Deploy", 848), ("24/7", "Expert Support", 1152)]
     for val, lbl, x in stats:
-        els += [
-            txt(x, 676, 176, 52, val, color=INDIGO, size=36, weight="bold", align="center"),
-            txt(x, 732, 176, 24, lbl, color=SLATE, size=14, align="center"),
-        ]
-    els += footer()
+        els += stamp(_STAT, x, 0, val, lbl)
     return els
 
 # ──────────────────────────────────────────────────────────────
 # PAGE 2: ABOUT
 # ──────────────────────────────────────────────────────────────
 
+_TEAM_MEMBER = (
+    rect(0, 616, 192, 8, fill=INDIGO_TINT, stroke=INDIGO_TINT, radius=4),  # color accent
+    img(0, 624, 192, 148),
+    txt(0, 780, 192, 24, None, color=NAVY, size=15, weight="bold", align="center"),
+    txt(0, 808, 192, 20, None, color=SLATE, size=13, align="center"),
+)
+
 def about_elements():
-    els = navbar("About")
+    els = []
     els += hero("Our Story",
                 "Founded in 2015, Acme Corp has been helping businesses succeed in the digital age.",
                 y=60, h=220, bg="#312E81")
@@ -214,24 +219,27 @@ def about_elements():
         ("James Rodriguez", "VP Engineering",   1056),
     ]
     for name, role, x in team:
-        els += [
-            rect(x, 616, 192, 8, fill="#C7D2FE", stroke="#C7D2FE", radius=4),  # color accent
-            img(x, 624, 192, 148),
-            txt(x, 780, 192, 24, name, color=NAVY, size=15, weight="bold", align="center"),
-            txt(x, 808, 192, 20, role, color=SLATE, size=13, align="center"),
-        ]
-    els += footer()
+        els += stamp(_TEAM_MEMBER, x, 0, name, role)
     return els
 
 # ──────────────────────────────────────────────────────────────
 # PAGE 3: SERVICES
 # ──────────────────────────────────────────────────────────────
 
+_SERVICE_CARD = (
+    rect(0, 296, 400, 368, fill=WHITE, stroke=BORDER, radius=10),
+    txt(24, 316, 352, 32, None, color=NAVY, size=20, weight="bold"),
+    txt(24, 352, 200, 28, None, color=GREEN, size=17, weight="bold"),
+    txt(24, 388, 352, 72, None, color=SLATE, size=14),
+)
+_SERVICE_FEATURE = (txt(24, 472, 352, 24, None, color=GREEN, size=14),)
+_SERVICE_CTA = (btn(24, 620, 352, 40, "Get Started", variant="secondary", size="md"),)
+
 def services_elements():
-    els = navbar("Services")
+    els = []
     els += hero("Our Services",
                 "End-to-end solutions tailored to accelerate your digital transformation.",
-                y=60, h=220, bg="#065F46")
+                y=60, h=220, bg=DARK_GREEN)
     svc_data = [
         (48,  "Cloud Infrastructure",  "From $299/mo",
          "Scalable, resilient cloud architecture on AWS, GCP, or Azure. 99.9% uptime SLA.",
@@ -244,37 +252,39 @@ def services_elements():
          ["Real-time dashboards", "ML & AI models", "Data pipelines", "Custom reports"]),
     ]
     for x, title, price, desc, features in svc_data:
-        els += [
-            rect(x, 296, 400, 368, fill=WHITE, stroke=BORDER, radius=10),
-            txt(x+24, 316, 352, 32, title, color=NAVY, size=20, weight="bold"),
-            txt(x+24, 352, 200, 28, price, color="#059669", size=17, weight="bold"),
-            txt(x+24, 388, 352, 72, desc, color=SLATE, size=14),
-        ]
+        els += stamp(_SERVICE_CARD, x, 0, title, price, desc)
         for i, feat in enumerate(features):
-            els.append(txt(x+24, 472+i*28, 352, 24, f"✓  {feat}", color="#059669", size=14))
-        els.append(btn(x+24, 620, 352, 40, "Get Started", variant="secondary", size="md"))
+            els += stamp(_SERVICE_FEATURE, x, i*28, f"✓  {feat}")
+        els += stamp(_SERVICE_CTA, x, 0)
     # CTA section
     els += [
-        rect(0, 688, 1440, 136, fill="#ECFDF5", stroke="#ECFDF5"),
+        rect(0, 688, 1440, 136, fill=LIGHT_GREEN, stroke=LIGHT_GREEN),
         txt(200, 708, 1040, 40, "Not sure which plan fits you?",
-            color="#065F46", size=26, weight="bold", align="center"),
+            color=DARK_GREEN, size=26, weight="bold", align="center"),
         txt(320, 756, 800, 28,
             "Talk to our experts — free 30-minute consultation, no strings attached.",
             color="#047857", size=16, align="center"),
         btn(600, 790, 240, 40, "Book a Free Call", variant="secondary", size="md"),
     ]
-    els += footer()
     return els
 
 # ──────────────────────────────────────────────────────────────
 # PAGE 4: PORTFOLIO
 # ──────────────────────────────────────────────────────────────
 
+_PROJECT_CARD = (
+    rect(0, 0, 416, 240, fill=LIGHT, stroke=BORDER, radius=10),
+    img(16, 16, 384, 152),
+    txt(16, 176, 260, 24, None, color=NAVY, size=15, weight="bold"),
+    txt(296, 180, 104, 18, None, color=VIOLET, size=12, align="right"),
+    txt(16, 208, 160, 20, "View Case Study →", color=INDIGO, size=13),
+)
+
 def portfolio_elements():
-    els = navbar("Portfolio")
+    els = []
     els += hero("Our Work",
                 "A selection of projects we are proud of — from startups to Fortune 500 companies.",
-                y=60, h=220, bg="#7C3AED")
+                y=60, h=220, bg=VIOLET)
     projects = [
         ("FinTech Dashboard",    "Data Analytics",  48,  296),
         ("HealthCare Portal",    "Product Dev",    512,  296),
@@ -284,14 +294,7 @@ def portfolio_elements():
         ("AI Analytics Suite",   "Data + AI",      976,  560),
     ]
     for title, cat, x, y in projects:
-        els += [
-            rect(x, y, 416, 240, fill=LIGHT, stroke=BORDER, radius=10),
-            img(x+16, y+16, 384, 152),
-            txt(x+16, y+176, 260, 24, title, color=NAVY, size=15, weight="bold"),
-            txt(x+296, y+180, 104, 18, cat, color="#7C3AED", size=12, align="right"),
-            txt(x+16, y+208, 160, 20, "View Case Study →", color=INDIGO, size=13),
-        ]
-    els += footer()
+        els += stamp(_PROJECT_CARD, x, y, title, cat)
     return els
 
 # ──────────────────────────────────────────────────────────────
@@ -299,7 +302,7 @@ def portfolio_elements():
 # ──────────────────────────────────────────────────────────────
 
 def contact_elements():
-    els = navbar("Contact")
+    els = []
     els += hero("Get In Touch",
                 "Have a project in mind? We would love to hear from you.",
                 y=60, h=196, bg="#BE185D")
@@ -327,7 +330,6 @@ def contact_elements():
         txt(824, 752, 512, 20, "Mon-Fri, 9 AM to 6 PM PST", color=SLATE, size=14),
         txt(824, 780, 512, 20, "Response time: within 1 business day", color=SLATE, size=14),
     ]
-    els += footer()
     return els
 
 # ──────────────────────────────────────────────────────────────
@@ -349,33 +351,66 @@ print("CORPORATE WEBSITE v2 — Correct component props")
 print(f"Project: {PROJECT_ID}")
 print("=" * 70)
 
-for idx, name, fn in PAGES:
-    print(f"\n[{idx}/5] {name}")
-
-    t0 = ms()
-    screen = add_screen(name)
-    screen_id = screen["id"]
-    elements = fn()
-    num_el = len(elements)
-    bulk(screen_id, elements)
-    t1 = ms()
-    creation = t1 - t0
-    print(f"  Created: {screen_id} | {num_el} elements | {creation} ms")
-
-    print(f"  Exporting PNG...")
-    te0 = ms()
+def timed_export(screen_id, key):
+    te0 = time.perf_counter_ns()
     try:
-        export_png(screen_id)
-        te1 = ms()
-        exp_ms = te1 - te0
-        print(f"  Export: {exp_ms} ms")
+        if CACHE:
+            hit = client.export_png_cached(screen_id, key, force=FORCE)
+        else:
+            hit = False
+            client.export_png(screen_id)
+        return elapsed_ms(te0), None, hit
     except Exception as e:
-        te1 = ms()
-        exp_ms = -(te1 - te0)
-        print(f"  Export FAILED: {e}")
-
-    results.append({"idx": idx, "name": name, "screen_id": screen_id,
-                    "creation_ms": creation, "num_elements": num_el, "export_ms": exp_ms})
+        return -elapsed_ms(te0), e, False
+
+# Page builders return only the page body; the shared chrome is added here,
+# already encoded
+def prepare(name, fn):
+    body = fn()
+    parts = (navbar_json(name), dumps(body)[1:-1], footer_json())
+    payload = b"[" + b",".join(p for p in parts if p) + b"]"
+    elements = [*navbar(name), *body, *footer()]
+    return payload, len(elements), client.export_key(SCREEN, elements) if CACHE else None
+
+# Exports are independent read-only renders and dominate wall time. Each one
+# is submitted the moment its screen exists, so it renders on the server while
+# the next page is still being created. Every page is built and hashed up
+# front on the same pool, overlapping the first create round trips; threads
+# rather than processes, since the builders take microseconds and a process
+# pool would spend far longer starting up and pickling the results back.
+t_run = time.perf_counter_ns()
+with ThreadPoolExecutor(max_workers=len(PAGES)) as pool:
+    prepared = [pool.submit(prepare, name, fn) for _, name, fn in PAGES]
+    futs = {}
+    for (idx, name, _), prep in zip(PAGES, prepared):
+        print(f"\n[{idx}/5] {name}")
+
+        t0 = time.perf_counter_ns()
+        payload, num_el, key = prep.result()
+        screen_id = client.create_screen_full(name, payload, **SCREEN)["screen_id"]
+        creation = elapsed_ms(t0)
+        print(f"  Created: {screen_id} | {num_el} elements | {creation} ms — export queued")
+
+        r = {"idx": idx, "name": name, "screen_id": screen_id,
+             "creation_ms": creation, "num_elements": num_el}
+        results.append(r)
+        futs[pool.submit(timed_export, screen_id, key)] = r, key
+
+    print(f"\nWaiting for {len(futs)} PNG exports...")
+    for f in as_completed(futs):
+        r, key = futs[f]
+        r["export_ms"], err, r["cached"] = f.result()
+        if err:
+            print(f"  {r['name']}: Export FAILED: {err}")
+        elif r["cached"]:
+            # The new screen has no server-side export; the earlier render of
+            # the identical page is the only PNG there is
+            print(f"  {r['name']}: unchanged since an earlier run — server export skipped for {r['screen_id']}")
+            print(f"    cached PNG: {EXPORT_CACHE / f'{key}.png'}")
+        else:
+            print(f"  {r['name']}: Export {r['export_ms']} ms")
+# Wall time: creates and exports overlap, so this is less than TOT summed
+wall = elapsed_ms(t_run)
 
 # Summary
 print("\n" + "=" * 74)
@@ -384,19 +419,22 @@ print("=" * 74)
 print(f"{'#':<3} {'Strona':<14} {'Tworzenie (ms)':<17} {'Elementow':<11} {'Export PNG (ms)'}")
 print("-" * 74)
 
-tot_c = tot_e = tot_n = 0
+# Export total/average cover real exports only: failed and cached rows are
+# left out
+tot_c = tot_e = tot_n = n_e = 0
 for r in results:
-    exp = str(r["export_ms"]) if r["export_ms"] >= 0 else "FAIL"
+    exp = "cached" if r["cached"] else str(r["export_ms"]) if r["export_ms"] >= 0 else "FAIL"
     print(f"{r['idx']:<3} {r['name']:<14} {r['creation_ms']:<17} {r['num_elements']:<11} {exp}")
     tot_c += r["creation_ms"]
-    if r["export_ms"] >= 0:
+    if r["export_ms"] >= 0 and not r["cached"]:
         tot_e += r["export_ms"]
+        n_e += 1
     tot_n += r["num_elements"]
 
 print("-" * 74)
 print(f"{'TOT':<3} {'':<14} {tot_c:<17} {tot_n:<11} {tot_e}")
-print(f"{'AVG':<3} {'':<14} {tot_c//5:<17} {tot_n//5:<11} {tot_e//5}")
-print(f"\nGrand total: {tot_c + tot_e} ms  ({(tot_c + tot_e)/1000:.2f} s)")
+print(f"{'AVG':<3} {'':<14} {tot_c//5:<17} {tot_n//5:<11} {tot_e//max(n_e, 1)}")
+print(f"\nGrand total: {wall} ms  ({wall/1000:.2f} s)")
 print(f"\nScreen IDs:")
 for r in results:
     print(f"  {r['name']}: {r['screen_id']}")
@@ -3,103 +3,38 @@
 Corporate Website mockup creation script.
 Measures time for each screen creation and PNG export.
 """
+import asyncio
+import functools
+import itertools
 import json
+import sys
 import time
-import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+
+from mockupmcp_client import EXPORT_CACHE, MockupClient, dumps, elapsed_ms
 
 SESSION_ID = "ffba88af-54d6-46c3-ad55-8abdfa7df1e0"
 BASE_URL = "http://localhost:3200/mcp"
 PROJECT_ID = "proj_oUwIukpLme"
+SCREEN = {"width": 1440, "height": 900, "background": "#FFFFFF", "style": "flat"}
 
-_id_counter = 100
-
-def next_id():
-    global _id_counter
-    _id_counter += 1
-    return _id_counter
-
-def mcp_call(method, params):
-    """Call MCP tool and return parsed result."""
-    payload = {
-        "jsonrpc": "2.0",
-        "id": next_id(),
-        "method": method,
-        "params": params
-    }
-    body = json.dumps(payload).encode()
-    req = urllib.request.Request(
-        BASE_URL,
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "Accept": "application/json, text/event-stream",
-            "mcp-session-id": SESSION_ID
-        },
-        method="POST"
-    )
-    with urllib.request.urlopen(req, timeout=300) as resp:
-        raw = resp.read().decode()
-
-    # Parse SSE or plain JSON
-    result_text = ""
-    for line in raw.splitlines():
-        if line.startswith("data: "):
-            result_text = line[6:]
-            break
-    if not result_text:
-        result_text = raw.strip()
-
-    data = json.loads(result_text)
-    if "error" in data:
-        raise Exception(f"MCP error: {data['error']}")
-    return data.get("result", {})
-
-def tool_call(tool_name, arguments):
-    result = mcp_call("tools/call", {"name": tool_name, "arguments": arguments})
-    content = result.get("content", [])
-    if result.get("isError"):
-        raise Exception(f"Tool error in {tool_name}: {content[0]['text'] if content else 'unknown'}")
-    if content and content[0].get("type") == "text":
-        try:
-            return json.loads(content[0]["text"])
-        except:
-            return content[0]["text"]
-    return result
-
-def ms():
-    return int(time.time() * 1000)
-
-def create_screen(name, width=1440, height=900, background="#FFFFFF", style="flat"):
-    return tool_call("mockup_add_screen", {
-        "project_id": PROJECT_ID,
-        "name": name,
-        "width": width,
-        "height": height,
-        "background": background,
-        "style": style
-    })
+# --cache: skip the server export of a page whose identical definition was
+# already rendered on an earlier run; the new screen then has no export of
+# its own and the earlier PNG under ~/.cache/mockupmcp (path printed) stands
+# in for it. Add --force to re-export everything and refresh the cache.
+CACHE = "--cache" in sys.argv[1:]
+FORCE = "--force" in sys.argv[1:]
 
-def bulk_add(screen_id, elements):
-    return tool_call("mockup_bulk_add_elements", {
-        "project_id": PROJECT_ID,
-        "screen_id": screen_id,
-        "elements": elements
-    })
-
-def export_png(screen_id):
-    return tool_call("mockup_export", {
-        "project_id": PROJECT_ID,
-        "screen_id": screen_id,
-        "format": "png",
-        "scale": 1
-    })
+client = MockupClient(SESSION_ID, BASE_URL, PROJECT_ID)
 
 # ============================================================
 # SCREEN DEFINITIONS
 # ============================================================
 
-# Common navbar elements (reused across pages)
+# Common navbar elements (reused across pages). Identical apart from the
+# active item, so each variant is built once and its (never mutated) element
+# dicts are shared through a cached tuple; pages copy it into a list.
+@functools.lru_cache(maxsize=8)
 def navbar_elements(active_item="Home"):
     items = ["Home", "About", "Services", "Portfolio", "Contact"]
     x_positions = [500, 590, 670, 760, 850]
@@ -120,10 +55,11 @@ def navbar_elements(active_item="Home"):
         "properties": {"label": "Get Started", "color": "#FFFFFF", "backgroundColor": "#4F46E5", "fontSize": 14},
         "z_index": 11
     })
-    return elems
+    return tuple(elems)
 
+@functools.lru_cache(maxsize=1)
 def footer_elements():
-    return [
+    return (
         {"type": "rectangle", "x": 0, "y": 840, "width": 1440, "height": 60,
          "properties": {"label": "", "backgroundColor": "#0F0F1A"}},
         {"type": "text", "x": 48, "y": 855, "width": 160, "height": 22,
@@ -132,23 +68,77 @@ def footer_elements():
          "properties": {"label": "© 2026 Acme Corp. All rights reserved.", "color": "#64748B", "fontSize": 13, "textAlign": "center"}},
         {"type": "text", "x": 1240, "y": 860, "width": 152, "height": 18,
          "properties": {"label": "Privacy · Terms · Contact", "color": "#64748B", "fontSize": 13}},
-    ]
+    )
 
+# Cached by its full argument tuple like the navbar; callers splice the
+# shared tuple into their own list
+@functools.lru_cache(maxsize=16)
 def section_hero(title, subtitle, y=60, height=280, bg="#4F46E5"):
-    return [
+    return (
         {"type": "rectangle", "x": 0, "y": y, "width": 1440, "height": height,
          "properties": {"label": "", "backgroundColor": bg}},
         {"type": "text", "x": 240, "y": y + 70, "width": 960, "height": 64,
          "properties": {"label": title, "color": "#FFFFFF", "fontSize": 48, "fontWeight": "bold", "textAlign": "center"}},
         {"type": "text", "x": 360, "y": y + 148, "width": 720, "height": 48,
          "properties": {"label": subtitle, "color": "#C7D2FE", "fontSize": 18, "textAlign": "center"}},
-    ]
+    )
+
+# Style shared by every bordered white card (service cards, the contact form
+# and contact info panels). Elements reference it rather than copying it; it
+# is never mutated.
+_WHITE_CARD_PROPS = {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
+                     "borderColor": "#E2E8F0", "borderWidth": 1}
+
+# Repeated blocks (cards, stats, team members, form fields) are laid out once
+# at import as template tables positioned at origin. stamp() copies a table
+# into place and fills the property values left as None, in order.
+def stamp(template, dx, dy, *values):
+    values = iter(values)
+    out = []
+    for el in template:
+        el = {**el, "x": el["x"] + dx, "y": el["y"] + dy}
+        props = el["properties"]
+        if None in props.values():
+            el["properties"] = {k: next(values) if v is None else v for k, v in props.items()}
+        out.append(el)
+    return out
 
 # ============================================================
 # PAGE 1: HOME
 # ============================================================
+_FEATURE_CARD = (
+    {"type": "rectangle", "x": 0, "y": 424, "width": 416, "height": 208,
+     "properties": {"label": "", "backgroundColor": "#F8FAFC", "borderRadius": 12}},
+    {"type": "text", "x": 24, "y": 444, "width": 368, "height": 32,
+     "properties": {"label": None, "color": "#1A1A2E", "fontSize": 20, "fontWeight": "bold"}},
+    {"type": "text", "x": 24, "y": 484, "width": 368, "height": 72,
+     "properties": {"label": None, "color": "#64748B", "fontSize": 15}},
+    {"type": "text", "x": 24, "y": 572, "width": 120, "height": 28,
+     "properties": {"label": "Learn more →", "color": "#4F46E5", "fontSize": 14}},
+)
+_STAT = (
+    {"type": "text", "x": 0, "y": 688, "width": 160, "height": 48,
+     "properties": {"label": None, "color": "#4F46E5", "fontSize": 36, "fontWeight": "bold", "textAlign": "center"}},
+    {"type": "text", "x": 0, "y": 740, "width": 160, "height": 24,
+     "properties": {"label": None, "color": "#64748B", "fontSize": 14, "textAlign": "center"}},
+)
+
+# Page content as module-level rows of plain tuples, unpacked in the loops
+# (the per-call lists of dicts were rebuilt and key-hashed on every build)
+_CARDS = (
+    (48,  "Lightning Fast", "Deploy in minutes with auto-scaling infrastructure that grows with your needs."),
+    (512, "Enterprise Security", "Bank-grade encryption and SOC2 compliance keeps your data safe 24/7."),
+    (976, "Advanced Analytics", "Real-time dashboards give you insights to make data-driven decisions."),
+)
+_STATS = (
+    (192,  "500+",  "Clients Worldwide"),
+    (528,  "99.9%", "Uptime SLA"),
+    (864,  "10x",   "Faster Deployment"),
+    (1152, "24/7",  "Expert Support"),
+)
+
 def home_elements():
-    elems = navbar_elements("Home")
+    elems = list(navbar_elements("Home"))
     # Hero section
     elems += [
         {"type": "rectangle", "x": 0, "y": 60, "width": 1440, "height": 340,
@@ -163,46 +153,36 @@ def home_elements():
          "properties": {"label": "Learn More", "color": "#FFFFFF", "backgroundColor": "#6366F1", "fontSize": 16}},
     ]
     # Feature cards
-    cards = [
-        {"icon": "Rocket", "title": "Lightning Fast", "desc": "Deploy in minutes with auto-scaling infrastructure that grows with your needs.", "x": 48},
-        {"icon": "Shield", "title": "Enterprise Security", "desc": "Bank-grade encryption and SOC2 compliance keeps your data safe 24/7.", "x": 512},
-        {"icon": "BarChart2", "title": "Advanced Analytics", "desc": "Real-time dashboards give you insights to make data-driven decisions.", "x": 976},
-    ]
-    for card in cards:
-        elems += [
-            {"type": "rectangle", "x": card["x"], "y": 424, "width": 416, "height": 208,
-             "properties": {"label": "", "backgroundColor": "#F8FAFC", "borderRadius": 12}},
-            {"type": "text", "x": card["x"] + 24, "y": 444, "width": 368, "height": 32,
-             "properties": {"label": card["title"], "color": "#1A1A2E", "fontSize": 20, "fontWeight": "bold"}},
-            {"type": "text", "x": card["x"] + 24, "y": 484, "width": 368, "height": 72,
-             "properties": {"label": card["desc"], "color": "#64748B", "fontSize": 15}},
-            {"type": "text", "x": card["x"] + 24, "y": 572, "width": 120, "height": 28,
-             "properties": {"label": "Learn more →", "color": "#4F46E5", "fontSize": 14}},
-        ]
+    for x, title, desc in _CARDS:
+        elems += stamp(_FEATURE_CARD, x, 0, title, desc)
     # Stats row
-    stats = [
-        {"val": "500+", "lbl": "Clients Worldwide", "x": 192},
-        {"val": "99.9%", "lbl": "Uptime SLA", "x": 528},
-        {"val": "10x", "lbl": "Faster Deployment", "x": 864},
-        {"val": "24/7", "lbl": "Expert Support", "x": 1152},
-    ]
     elems.append({"type": "rectangle", "x": 0, "y": 660, "width": 1440, "height": 152,
                   "properties": {"label": "", "backgroundColor": "#EEF2FF"}})
-    for s in stats:
-        elems += [
-            {"type": "text", "x": s["x"], "y": 688, "width": 160, "height": 48,
-             "properties": {"label": s["val"], "color": "#4F46E5", "fontSize": 36, "fontWeight": "bold", "textAlign": "center"}},
-            {"type": "text", "x": s["x"], "y": 740, "width": 160, "height": 24,
-             "properties": {"label": s["lbl"], "color": "#64748B", "fontSize": 14, "textAlign": "center"}},
-        ]
+    for x, val, lbl in _STATS:
+        elems += stamp(_STAT, x, 0, val, lbl)
     elems += footer_elements()
     return elems
 
 # ============================================================
 # PAGE 2: ABOUT
 # ============================================================
+_TEAM_MEMBER = (
+    {"type": "image", "x": 0, "y": 608, "width": 192, "height": 160,
+     "properties": {"label": None, "backgroundColor": "#C7D2FE", "borderRadius": 8}},
+    {"type": "text", "x": 0, "y": 776, "width": 192, "height": 24,
+     "properties": {"label": None, "color": "#1A1A2E", "fontSize": 16, "fontWeight": "bold", "textAlign": "center"}},
+    {"type": "text", "x": 0, "y": 804, "width": 192, "height": 20,
+     "properties": {"label": None, "color": "#64748B", "fontSize": 13, "textAlign": "center"}},
+)
+_TEAM = (
+    (144,  "Sarah Chen",      "CEO & Co-Founder"),
+    (464,  "Marcus Williams", "CTO & Co-Founder"),
+    (784,  "Priya Patel",     "Head of Design"),
+    (1104, "James Rodriguez", "VP Engineering"),
+)
+
 def about_elements():
-    elems = navbar_elements("About")
+    elems = list(navbar_elements("About"))
     elems += section_hero(
         "Our Story",
         "Founded in 2015, Acme Corp has been helping businesses succeed in the digital age.",
@@ -224,120 +204,128 @@ def about_elements():
     # Team grid
     elems.append({"type": "text", "x": 0, "y": 556, "width": 1440, "height": 40,
                    "properties": {"label": "Meet the Team", "color": "#1A1A2E", "fontSize": 28, "fontWeight": "bold", "textAlign": "center"}})
-    team = [
-        {"name": "Sarah Chen", "role": "CEO & Co-Founder", "x": 144},
-        {"name": "Marcus Williams", "role": "CTO & Co-Founder", "x": 464},
-        {"name": "Priya Patel", "role": "Head of Design", "x": 784},
-        {"name": "James Rodriguez", "role": "VP Engineering", "x": 1104},
-    ]
-    for p in team:
-        elems += [
-            {"type": "image", "x": p["x"], "y": 608, "width": 192, "height": 160,
-             "properties": {"label": p["name"], "backgroundColor": "#C7D2FE", "borderRadius": 8}},
-            {"type": "text", "x": p["x"], "y": 776, "width": 192, "height": 24,
-             "properties": {"label": p["name"], "color": "#1A1A2E", "fontSize": 16, "fontWeight": "bold", "textAlign": "center"}},
-            {"type": "text", "x": p["x"], "y": 804, "width": 192, "height": 20,
-             "properties": {"label": p["role"], "color": "#64748B", "fontSize": 13, "textAlign": "center"}},
-        ]
+    for x, name, role in _TEAM:
+        elems += stamp(_TEAM_MEMBER, x, 0, name, name, role)
     elems += footer_elements()
     return elems
 
 # ============================================================
 # PAGE 3: SERVICES
 # ============================================================
+_SERVICE_CARD = (
+    {"type": "rectangle", "x": 0, "y": 296, "width": 400, "height": 360,
+     "properties": _WHITE_CARD_PROPS},
+    {"type": "text", "x": 24, "y": 316, "width": 352, "height": 32,
+     "properties": {"label": None, "color": "#1A1A2E", "fontSize": 22, "fontWeight": "bold"}},
+    {"type": "text", "x": 24, "y": 352, "width": 200, "height": 28,
+     "properties": {"label": None, "color": "#059669", "fontSize": 18, "fontWeight": "bold"}},
+    {"type": "text", "x": 24, "y": 392, "width": 352, "height": 80,
+     "properties": {"label": None, "color": "#475569", "fontSize": 14}},
+)
+_SERVICE_FEATURE = (
+    {"type": "text", "x": 24, "y": 488, "width": 352, "height": 24,
+     "properties": {"label": None, "color": "#059669", "fontSize": 14}},
+)
+_SERVICE_CTA = (
+    {"type": "button", "x": 24, "y": 616, "width": 352, "height": 40,
+     "properties": {"label": "Get Started", "color": "#FFFFFF", "backgroundColor": "#059669", "fontSize": 15}},
+)
+_SERVICES = (
+    (48, "Cloud Infrastructure", "From $299/mo",
+     "Scalable, resilient cloud architecture on AWS, GCP, or Azure. Auto-scaling, load balancing, and 99.9% uptime SLA included.",
+     ("✓  Multi-cloud support", "✓  Auto-scaling", "✓  24/7 monitoring", "✓  DDoS protection")),
+    (496, "Product Development", "From $4,999/mo",
+     "Full-cycle product development from idea to launch. Our agile teams deliver high-quality software on time and on budget.",
+     ("✓  Agile sprints", "✓  UI/UX design", "✓  QA & testing", "✓  Post-launch support")),
+    (944, "Data & Analytics", "From $1,499/mo",
+     "Transform your raw data into actionable insights. Real-time dashboards, ML models, and predictive analytics at scale.",
+     ("✓  Real-time dashboards", "✓  ML & AI models", "✓  Data pipelines", "✓  Custom reports")),
+)
+
+# Fixed CTA band under the cards
+_CTA_SECTION = (
+    {"type": "rectangle", "x": 0, "y": 680, "width": 1440, "height": 144,
+     "properties": {"label": "", "backgroundColor": "#ECFDF5"}},
+    {"type": "text", "x": 240, "y": 700, "width": 960, "height": 40,
+     "properties": {"label": "Not sure which plan fits you?", "color": "#065F46", "fontSize": 28, "fontWeight": "bold", "textAlign": "center"}},
+    {"type": "text", "x": 360, "y": 748, "width": 720, "height": 28,
+     "properties": {"label": "Talk to our experts — free 30-minute consultation, no strings attached.", "color": "#047857", "fontSize": 16, "textAlign": "center"}},
+    {"type": "button", "x": 600, "y": 784, "width": 240, "height": 40,
+     "properties": {"label": "Book a Free Call", "color": "#FFFFFF", "backgroundColor": "#059669", "fontSize": 16}},
+)
+
+def _service_cards():
+    for x, title, price, desc, features in _SERVICES:
+        yield from stamp(_SERVICE_CARD, x, 0, title, price, desc)
+        for j, feat in enumerate(features):
+            yield from stamp(_SERVICE_FEATURE, x, j * 28, feat)
+        yield from stamp(_SERVICE_CTA, x, 0)
+
+# Sections are chained and realized into one list at the end, rather than
+# growing a list section by section
 def services_elements():
-    elems = navbar_elements("Services")
-    elems += section_hero(
-        "Our Services",
-        "End-to-end solutions tailored to accelerate your digital transformation journey.",
-        y=60, height=220, bg="#065F46"
-    )
-    services = [
-        {"title": "Cloud Infrastructure", "price": "From $299/mo",
-         "desc": "Scalable, resilient cloud architecture on AWS, GCP, or Azure. Auto-scaling, load balancing, and 99.9% uptime SLA included.",
-         "features": ["Multi-cloud support", "Auto-scaling", "24/7 monitoring", "DDoS protection"],
-         "x": 48},
-        {"title": "Product Development", "price": "From $4,999/mo",
-         "desc": "Full-cycle product development from idea to launch. Our agile teams deliver high-quality software on time and on budget.",
-         "features": ["Agile sprints", "UI/UX design", "QA & testing", "Post-launch support"],
-         "x": 496},
-        {"title": "Data & Analytics", "price": "From $1,499/mo",
-         "desc": "Transform your raw data into actionable insights. Real-time dashboards, ML models, and predictive analytics at scale.",
-         "features": ["Real-time dashboards", "ML & AI models", "Data pipelines", "Custom reports"],
-         "x": 944},
-    ]
-    for svc in services:
-        elems += [
-            {"type": "rectangle", "x": svc["x"], "y": 296, "width": 400, "height": 360,
-             "properties": {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
-                            "borderColor": "#E2E8F0", "borderWidth": 1}},
-            {"type": "text", "x": svc["x"] + 24, "y": 316, "width": 352, "height": 32,
-             "properties": {"label": svc["title"], "color": "#1A1A2E", "fontSize": 22, "fontWeight": "bold"}},
-            {"type": "text", "x": svc["x"] + 24, "y": 352, "width": 200, "height": 28,
-             "properties": {"label": svc["price"], "color": "#059669", "fontSize": 18, "fontWeight": "bold"}},
-            {"type": "text", "x": svc["x"] + 24, "y": 392, "width": 352, "height": 80,
-             "properties": {"label": svc["desc"], "color": "#475569", "fontSize": 14}},
-        ]
-        for j, feat in enumerate(svc["features"]):
-            elems.append({
-                "type": "text", "x": svc["x"] + 24, "y": 488 + j * 28, "width": 352, "height": 24,
-                "properties": {"label": f"✓  {feat}", "color": "#059669", "fontSize": 14}
-            })
-        elems.append({
-            "type": "button", "x": svc["x"] + 24, "y": 616, "width": 352, "height": 40,
-            "properties": {"label": "Get Started", "color": "#FFFFFF", "backgroundColor": "#059669", "fontSize": 15}
-        })
-    # CTA section
-    elems += [
-        {"type": "rectangle", "x": 0, "y": 680, "width": 1440, "height": 144,
-         "properties": {"label": "", "backgroundColor": "#ECFDF5"}},
-        {"type": "text", "x": 240, "y": 700, "width": 960, "height": 40,
-         "properties": {"label": "Not sure which plan fits you?", "color": "#065F46", "fontSize": 28, "fontWeight": "bold", "textAlign": "center"}},
-        {"type": "text", "x": 360, "y": 748, "width": 720, "height": 28,
-         "properties": {"label": "Talk to our experts — free 30-minute consultation, no strings attached.", "color": "#047857", "fontSize": 16, "textAlign": "center"}},
-        {"type": "button", "x": 600, "y": 784, "width": 240, "height": 40,
-         "properties": {"label": "Book a Free Call", "color": "#FFFFFF", "backgroundColor": "#059669", "fontSize": 16}},
-    ]
-    elems += footer_elements()
-    return elems
+    return list(itertools.chain(
+        navbar_elements("Services"),
+        section_hero(
+            "Our Services",
+            "End-to-end solutions tailored to accelerate your digital transformation journey.",
+            y=60, height=220, bg="#065F46"
+        ),
+        _service_cards(),
+        _CTA_SECTION,
+        footer_elements(),
+    ))
 
 # ============================================================
 # PAGE 4: PORTFOLIO
 # ============================================================
+_PROJECT_CARD = (
+    {"type": "rectangle", "x": 0, "y": 0, "width": 416, "height": 228,
+     "properties": {"label": "", "backgroundColor": "#F8FAFC", "borderRadius": 10}},
+    {"type": "image", "x": 16, "y": 16, "width": 384, "height": 152,
+     "properties": {"label": None, "backgroundColor": None}},
+    {"type": "text", "x": 16, "y": 176, "width": 256, "height": 24,
+     "properties": {"label": None, "color": "#1A1A2E", "fontSize": 16, "fontWeight": "bold"}},
+    {"type": "text", "x": 280, "y": 179, "width": 120, "height": 18,
+     "properties": {"label": None, "color": "#7C3AED", "fontSize": 12, "textAlign": "right"}},
+)
+_PROJECTS = (
+    (48,  296, "FinTech Dashboard",   "Data Analytics", "#DBEAFE"),
+    (512, 296, "HealthCare Portal",   "Product Dev",    "#DCF5E7"),
+    (976, 296, "E-Commerce Platform", "Cloud + Dev",    "#FEF3C7"),
+    (48,  564, "Logistics Tracker",   "Mobile App",     "#FCE7F3"),
+    (512, 564, "EdTech Learning LMS", "Product Dev",    "#EDE9FE"),
+    (976, 564, "AI Analytics Suite",  "Data + AI",      "#CFFAFE"),
+)
+# The grid is fixed, so its coordinate arithmetic runs once, at import
+_PORTFOLIO_CARDS = tuple(el for x, y, title, cat, color in _PROJECTS
+                         for el in stamp(_PROJECT_CARD, x, y, title, color, title, cat))
+
 def portfolio_elements():
-    elems = navbar_elements("Portfolio")
-    elems += section_hero(
-        "Our Work",
-        "A selection of projects we're proud of — from startups to Fortune 500 companies.",
-        y=60, height=220, bg="#7C3AED"
-    )
-    projects = [
-        {"title": "FinTech Dashboard", "cat": "Data Analytics", "color": "#DBEAFE", "x": 48, "y": 296},
-        {"title": "HealthCare Portal", "cat": "Product Dev", "color": "#DCF5E7", "x": 512, "y": 296},
-        {"title": "E-Commerce Platform", "cat": "Cloud + Dev", "color": "#FEF3C7", "x": 976, "y": 296},
-        {"title": "Logistics Tracker", "cat": "Mobile App", "color": "#FCE7F3", "x": 48, "y": 564},
-        {"title": "EdTech Learning LMS", "cat": "Product Dev", "color": "#EDE9FE", "x": 512, "y": 564},
-        {"title": "AI Analytics Suite", "cat": "Data + AI", "color": "#CFFAFE", "x": 976, "y": 564},
-    ]
-    for p in projects:
-        elems += [
-            {"type": "rectangle", "x": p["x"], "y": p["y"], "width": 416, "height": 228,
-             "properties": {"label": "", "backgroundColor": "#F8FAFC", "borderRadius": 10}},
-            {"type": "image", "x": p["x"] + 16, "y": p["y"] + 16, "width": 384, "height": 152,
-             "properties": {"label": p["title"], "backgroundColor": p["color"]}},
-            {"type": "text", "x": p["x"] + 16, "y": p["y"] + 176, "width": 256, "height": 24,
-             "properties": {"label": p["title"], "color": "#1A1A2E", "fontSize": 16, "fontWeight": "bold"}},
-            {"type": "text", "x": p["x"] + 280, "y": p["y"] + 179, "width": 120, "height": 18,
-             "properties": {"label": p["cat"], "color": "#7C3AED", "fontSize": 12, "textAlign": "right"}},
-        ]
-    elems += footer_elements()
-    return elems
+    return list(itertools.chain(
+        navbar_elements("Portfolio"),
+        section_hero(
+            "Our Work",
+            "A selection of projects we're proud of — from startups to Fortune 500 companies.",
+            y=60, height=220, bg="#7C3AED"
+        ),
+        _PORTFOLIO_CARDS,
+        footer_elements(),
+    ))
 
 # ============================================================
 # PAGE 5: CONTACT
 # ============================================================
+_FORM_FIELD = (
+    {"type": "text", "x": 112, "y": 0, "width": 200, "height": 20,
+     "properties": {"label": None, "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
+    {"type": "input", "x": 112, "y": 24, "width": 608, "height": 48,
+     "properties": {"label": None, "color": "#9CA3AF", "fontSize": 15,
+                    "backgroundColor": "#F9FAFB", "borderColor": "#D1D5DB"}},
+)
+
 def contact_elements():
-    elems = navbar_elements("Contact")
+    elems = list(navbar_elements("Contact"))
     elems += section_hero(
         "Get In Touch",
         "Have a project in mind? We'd love to hear from you. Send us a message!",
@@ -346,28 +334,15 @@ def contact_elements():
     # Contact form
     elems += [
         {"type": "rectangle", "x": 80, "y": 272, "width": 672, "height": 528,
-         "properties": {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
-                        "borderColor": "#E2E8F0", "borderWidth": 1}},
+         "properties": _WHITE_CARD_PROPS},
         {"type": "text", "x": 112, "y": 296, "width": 608, "height": 32,
          "properties": {"label": "Send Us a Message", "color": "#1A1A2E", "fontSize": 22, "fontWeight": "bold"}},
-        # Name field
-        {"type": "text", "x": 112, "y": 344, "width": 200, "height": 20,
-         "properties": {"label": "Full Name *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
-        {"type": "input", "x": 112, "y": 368, "width": 608, "height": 48,
-         "properties": {"label": "John Doe", "color": "#9CA3AF", "fontSize": 15,
-                        "backgroundColor": "#F9FAFB", "borderColor": "#D1D5DB"}},
-        # Email field
-        {"type": "text", "x": 112, "y": 432, "width": 200, "height": 20,
-         "properties": {"label": "Email Address *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
-        {"type": "input", "x": 112, "y": 456, "width": 608, "height": 48,
-         "properties": {"label": "john@example.com", "color": "#9CA3AF", "fontSize": 15,
-                        "backgroundColor": "#F9FAFB", "borderColor": "#D1D5DB"}},
-        # Subject field
-        {"type": "text", "x": 112, "y": 520, "width": 200, "height": 20,
-         "properties": {"label": "Subject", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
-        {"type": "input", "x": 112, "y": 544, "width": 608, "height": 48,
-         "properties": {"label": "How can we help?", "color": "#9CA3AF", "fontSize": 15,
-                        "backgroundColor": "#F9FAFB", "borderColor": "#D1D5DB"}},
+    ]
+    # Name, email and subject fields
+    elems += stamp(_FORM_FIELD, 0, 344, "Full Name *", "John Doe")
+    elems += stamp(_FORM_FIELD, 0, 432, "Email Address *", "john@example.com")
+    elems += stamp(_FORM_FIELD, 0, 520, "Subject", "How can we help?")
+    elems += [
         # Message textarea
         {"type": "text", "x": 112, "y": 608, "width": 200, "height": 20,
          "properties": {"label": "Message *", "color": "#374151", "fontSize": 14, "fontWeight": "bold"}},
@@ -385,8 +360,7 @@ def contact_elements():
          "properties": {"label": "📍 Map — 123 Innovation Drive, San Francisco CA", "backgroundColor": "#CBD5E1"}},
         # Contact info
         {"type": "rectangle", "x": 800, "y": 624, "width": 560, "height": 176,
-         "properties": {"label": "", "backgroundColor": "#FFFFFF", "borderRadius": 12,
-                        "borderColor": "#E2E8F0", "borderWidth": 1}},
+         "properties": _WHITE_CARD_PROPS},
         {"type": "text", "x": 824, "y": 640, "width": 512, "height": 24,
          "properties": {"label": "Contact Information", "color": "#1A1A2E", "fontSize": 18, "fontWeight": "bold"}},
         {"type": "text", "x": 824, "y": 672, "width": 512, "height": 20,
@@ -413,6 +387,14 @@ pages = [
     ("Contact",   contact_elements),
 ]
 
+# Every page is a pure function of constants, so all five are built and
+# JSON-encoded once up front; the create loop only sends ready-made bytes
+def encode_page(elements_fn):
+    elements = elements_fn()
+    return dumps(elements), len(elements), client.export_key(SCREEN, elements) if CACHE else None
+
+encoded_pages = [(name, *encode_page(elements_fn)) for name, elements_fn in pages]
+
 results = []
 
 print("=" * 60)
@@ -420,77 +402,120 @@ print("CORPORATE WEBSITE — MockupMCP")
 print(f"Project: {PROJECT_ID}")
 print("=" * 60)
 
-screen_ids = {}
-
-for idx, (name, elements_fn) in enumerate(pages, 1):
-    print(f"\n[{idx}/5] Creating screen: {name}")
-
-    # Measure screen creation time
-    t_start = ms()
-
-    # Step 1: Create screen
-    screen = create_screen(name)
-    screen_id = screen["id"]
-    screen_ids[name] = screen_id
-    print(f"  Screen created: {screen_id}")
-
-    # Step 2: Build elements
-    elements = elements_fn()
-    num_elements = len(elements)
-
-    # Step 3: Bulk add elements
-    bulk_add(screen_id, elements)
-
-    t_end = ms()
-    creation_time = t_end - t_start
-
-    print(f"  Elements: {num_elements}")
-    print(f"  Creation time: {creation_time} ms")
-
-    # Step 4: Export PNG (measured separately)
-    print(f"  Exporting PNG...")
-    t_exp_start = ms()
-    export_result = export_png(screen_id)
-    t_exp_end = ms()
-    export_time = t_exp_end - t_exp_start
-
-    print(f"  Export time: {export_time} ms")
-
-    results.append({
-        "idx": idx,
-        "name": name,
-        "screen_id": screen_id,
-        "creation_ms": creation_time,
-        "num_elements": num_elements,
-        "export_ms": export_time,
-    })
+async def export_page(row, key):
+    """Export one page's PNG and record its export time (measured separately).
+
+    With --cache, the server export is skipped when the same page was
+    already rendered on an earlier run."""
+    t_exp_start = time.perf_counter_ns()
+    row["cached"] = False
+    try:
+        if CACHE:
+            row["cached"] = await asyncio.to_thread(client.export_png_cached, row["screen_id"], key, FORCE)
+        else:
+            await asyncio.to_thread(client.export_png, row["screen_id"])
+        row["export_ms"] = elapsed_ms(t_exp_start)
+    except Exception as e:
+        # A failed export must not take the other pages' results down with it
+        print(f"  {row['name']}: export FAILED after {elapsed_ms(t_exp_start)} ms: {e}")
+        row["export_ms"] = -1
+        return
+    if row["cached"]:
+        print(f"  {row['name']}: unchanged since an earlier run — server export skipped for {row['screen_id']}")
+        print(f"    cached PNG: {EXPORT_CACHE / f'{key}.png'}")
+    else:
+        print(f"  {row['name']}: export time: {row['export_ms']} ms")
+
+async def main():
+    # Client calls block, so they run on worker threads (each with its own
+    # keep-alive connection); size the pool for every export at once
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=len(pages), thread_name_prefix="mcp"))
+
+    exports = []
+    for idx, (name, payload, num_elements, key) in enumerate(encoded_pages, 1):
+        print(f"\n[{idx}/5] Creating screen: {name}")
+
+        # Measure screen creation time
+        t_start = time.perf_counter_ns()
+
+        # Step 1: Create screen with all its elements (one round trip instead
+        # of add_screen + bulk_add)
+        screen = await asyncio.to_thread(client.create_screen_full, name, payload, **SCREEN)
+        screen_id = screen["screen_id"]
+        print(f"  Screen created: {screen_id}")
+
+        creation_time = elapsed_ms(t_start)
+
+        print(f"  Elements: {num_elements}")
+        print(f"  Creation time: {creation_time} ms")
+
+        row = {
+            "idx": idx,
+            "name": name,
+            "screen_id": screen_id,
+            "creation_ms": creation_time,
+            "num_elements": num_elements,
+        }
+        results.append(row)
+
+        # Step 2: Export PNG in the background — it renders on the server
+        # while the next page is built and created
+        print(f"  Export queued")
+        exports.append(asyncio.create_task(export_page(row, key)))
+
+    print(f"\nWaiting for {len(exports)} PNG exports...")
+    await asyncio.gather(*exports)
+
+# Wall time of the whole run: creates and exports overlap, so the column
+# totals below add up to more than this
+t_run = time.perf_counter_ns()
+asyncio.run(main())
+total_time = elapsed_ms(t_run)
+screen_ids = {r["name"]: r["screen_id"] for r in results}
 
 # ============================================================
 # SUMMARY TABLE
 # ============================================================
-print("\n" + "=" * 70)
-print("RESULTS")
-print("=" * 70)
-print(f"{'#':<3} {'Page':<14} {'Creation (ms)':<16} {'Elements':<10} {'Export PNG (ms)':<16}")
-print("-" * 70)
+# Assembled in full and written once rather than line by line
+lines = [
+    "",
+    "=" * 70,
+    "RESULTS",
+    "=" * 70,
+    f"{'#':<3} {'Page':<14} {'Creation (ms)':<16} {'Elements':<10} {'Export PNG (ms)':<16}",
+    "-" * 70,
+]
 
 total_creation = 0
 total_export = 0
+exported = 0
 total_elements = 0
 
 for r in results:
-    print(f"{r['idx']:<3} {r['name']:<14} {r['creation_ms']:<16} {r['num_elements']:<10} {r['export_ms']:<16}")
+    # Failed and cached rows are left out of the export total and average
+    if r["export_ms"] < 0:
+        export = "FAIL"
+    elif r["cached"]:
+        export = "cached"
+    else:
+        export = r["export_ms"]
+        total_export += r["export_ms"]
+        exported += 1
+    lines.append(f"{r['idx']:<3} {r['name']:<14} {r['creation_ms']:<16} {r['num_elements']:<10} {export:<16}")
     total_creation += r["creation_ms"]
-    total_export += r["export_ms"]
     total_elements += r["num_elements"]
 
-print("-" * 70)
-total_time = total_creation + total_export
 avg_creation = total_creation // 5
-avg_export = total_export // 5
-
-print(f"{'TOTAL':<3} {'':<14} {total_creation:<16} {total_elements:<10} {total_export:<16}")
-print(f"{'AVG':<3} {'':<14} {avg_creation:<16} {total_elements//5:<10} {avg_export:<16}")
-print(f"\nGrand total time: {total_time} ms  ({total_time/1000:.1f} s)")
-print(f"Screen IDs: {json.dumps(screen_ids, indent=2)}")
-print("=" * 70)
+avg_export = total_export // max(exported, 1)
+
+lines += [
+    "-" * 70,
+    f"{'TOTAL':<3} {'':<14} {total_creation:<16} {total_elements:<10} {total_export:<16}",
+    f"{'AVG':<3} {'':<14} {avg_creation:<16} {total_elements//5:<10} {avg_export:<16}",
+    "",
+    f"Grand total time: {total_time} ms  ({total_time/1000:.1f} s)",
+    f"Screen IDs: {json.dumps(screen_ids, indent=2)}",
+    "=" * 70,
+]
+sys.stdout.write("\n".join(lines) + "\n")
@@ -0,0 +1,188 @@
+"""
+Minimal MockupMCP client shared by the corporate-website scripts.
+
+Talks JSON-RPC to the streamable HTTP transport over keep-alive
+connections (one per thread — HTTPConnection isn't thread-safe) and
+accepts either SSE or plain JSON responses. The transport is a plain
+Express app.listen() server, i.e. cleartext HTTP/1.1 only, so concurrent
+calls get one socket each rather than multiplexed h2 streams.
+"""
+import base64
+import hashlib
+import http.client
+import itertools
+import json
+import os
+import pathlib
+import threading
+import time
+import urllib.parse
+
+try:
+    import orjson
+    dumps = orjson.dumps    # C encoder, emits bytes directly
+    _loads = orjson.loads   # takes the response bytes as-is
+except ImportError:
+    def dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+
+# Rendered PNGs keyed by a hash of the screen definition (see export_key),
+# shared by every client; export_png_cached reads and fills it
+EXPORT_CACHE = pathlib.Path.home() / ".cache" / "mockupmcp"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def elapsed_ms(start_ns):
+    """Whole milliseconds since start_ns, a time.perf_counter_ns() reading."""
+    # Integer ns from a monotonic clock, rounded down once per interval: no
+    # float math, unaffected by NTP steps
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
+class MCPHTTPError(Exception):
+    """Non-2xx reply from the transport; status lets callers spot 5xx."""
+
+    def __init__(self, status, reason, body=b""):
+        super().__init__(f"HTTP {status} {reason}: {body[:200]!r}")
+        self.status = status
+
+
+class MockupClient:
+    def __init__(self, session_id, base_url, project_id):
+        self.project_id = project_id
+        self._url = urllib.parse.urlsplit(base_url)
+        self._headers = {
+            "Content-Type": "application/json",
+            # The SDK transport answers 406 unless SSE is accepted too
+            "Accept": "application/json, text/event-stream",
+            "mcp-session-id": session_id,
+        }
+        self._ids = itertools.count(1)   # safe to advance from worker threads
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(
+                self._url.hostname, self._url.port, timeout=300)
+        return conn
+
+    def call(self, method, params):
+        """Send one JSON-RPC request and return its result."""
+        return self._send(dumps(self._envelope(method, params)))
+
+    def _envelope(self, method, params):
+        return {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params}
+
+    def _elements_body(self, name, args, elements):
+        # The element array is the only sizeable part of a create body:
+        # encode the small envelope on its own and splice the array (given
+        # pre-encoded, or encoded here) in as the last argument
+        head = dumps(self._envelope("tools/call", {"name": name, "arguments": args}))
+        if not isinstance(elements, bytes):
+            elements = dumps(elements)
+        return head[:-3] + b',"elements":' + elements + b"}}}"
+
+    def _send(self, body):
+        conn = self._connection()
+        try:
+            # body is bytes, so http.client sends one Content-Length-framed
+            # body (never chunked); keep it that way rather than streaming
+            conn.request("POST", self._url.path, body, self._headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()  # drop the broken socket; the next call reconnects
+            raise
+        if resp.status >= 400:
+            raise MCPHTTPError(resp.status, resp.reason, raw)
+        if resp.headers.get_content_type() == "text/event-stream":
+            pos = raw.find(b"data: ")
+            if pos >= 0:
+                end = raw.find(b"\n", pos)
+                raw = raw[pos + 6:end if end >= 0 else None]
+        data = _loads(raw)
+        if "error" in data:
+            raise Exception(f"MCP error: {data['error']}")
+        return data.get("result", {})
+
+    def _tool_result(self, name, args, elements=None):
+        if elements is None:
+            result = self.call("tools/call", {"name": name, "arguments": args})
+        else:
+            result = self._send(self._elements_body(name, args, elements))
+        if result.get("isError"):
+            content = result.get("content", [])
+            raise Exception(f"{name} error: {content[0]['text'] if content else '?'}")
+        return result
+
+    def tool(self, name, args, elements=None):
+        """Call a tool; returns its first text item, JSON-decoded when possible.
+
+        elements (a list, or its already-encoded JSON bytes) is sent as the
+        trailing "elements" argument.
+        """
+        result = self._tool_result(name, args, elements)
+        content = result.get("content", [])
+        if content and content[0].get("type") == "text":
+            try:
+                return _loads(content[0]["text"])
+            except ValueError:
+                return content[0]["text"]
+        return result
+
+    # add_screen + bulk chained server-side: one round trip per page. Not sent
+    # as a JSON-RPC batch — the SDK runs batch entries concurrently and every
+    # screen write rewrites the whole project file, so batched creates race.
+    # Export is deliberately not folded in: creates must stay sequential, and
+    # a render chained onto each one would hold up the next page's create.
+    def create_screen_full(self, name, elements, width=1440, height=900,
+                           background="#FFFFFF", style="flat"):
+        return self.tool("mockup_create_screen_full", {
+            "project_id": self.project_id, "name": name,
+            "width": width, "height": height, "background": background, "style": style,
+        }, elements)
+
+    def export_png(self, screen_id, scale=1):
+        """Export a screen and return the PNG bytes."""
+        result = self._tool_result("mockup_export", {
+            "project_id": self.project_id, "screen_id": screen_id, "format": "png", "scale": scale,
+        })
+        return next((base64.b64decode(c["data"]) for c in result.get("content", [])
+                     if c.get("type") == "image"), b"")
+
+    def export_key(self, screen, elements):
+        """Cache key for a screen definition, scoped to this client's project."""
+        # Canonical stdlib encoding (sorted, compact) so equal screens always
+        # hash equal, whether or not orjson is installed
+        canon = json.dumps({"project_id": self.project_id, "screen": screen, "elements": elements},
+                           sort_keys=True, separators=(",", ":")).encode()
+        return hashlib.blake2b(canon, digest_size=16).hexdigest()
+
+    def export_png_cached(self, screen_id, key, force=False):
+        """Export unless an identical screen was rendered before. True on cache hit.
+
+        On a hit no export is requested, so the server holds no PNG for
+        screen_id; the cached file under EXPORT_CACHE is the only render.
+        force=True always exports and overwrites the cached file.
+        """
+        path = EXPORT_CACHE / f"{key}.png"
+        if not force:
+            # Only a file that starts like a PNG counts; anything else (empty,
+            # truncated, foreign) is re-exported and overwritten
+            try:
+                with path.open("rb") as f:
+                    if f.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE:
+                        return True
+            except FileNotFoundError:
+                pass
+        png = self.export_png(screen_id)
+        if not png.startswith(PNG_SIGNATURE):
+            raise Exception(f"mockup_export returned no PNG for {screen_id}")
+        EXPORT_CACHE.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(png)
+        os.replace(tmp, path)
+        return False